@@ -0,0 +1,44 @@
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+
+def _max_accel_norm_numpy(sensor_array: np.ndarray) -> float:
+    if sensor_array.shape[0] == 0:
+        return 0.0
+    accel = sensor_array[:, :3]
+    # Max of squared norms, then a single sqrt; squares are taken in float64 so large
+    # float32 readings cannot overflow to inf
+    return float(np.sqrt(np.einsum("ij,ij->i", accel, accel, dtype=np.float64).max()))
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _max_accel_norm_jit(sensor_array):
+        # Single pass over the rows with no intermediate norm vector
+        peak = 0.0
+        for i in range(sensor_array.shape[0]):
+            # Widen to float64 so squaring large float32 readings cannot overflow
+            ax = np.float64(sensor_array[i, 0])
+            ay = np.float64(sensor_array[i, 1])
+            az = np.float64(sensor_array[i, 2])
+            squared = ax * ax + ay * ay + az * az
+            if squared > peak:
+                peak = squared
+        return math.sqrt(peak)
+
+    # Compile for the float32 buffers built by the API now, not on the first request
+    _max_accel_norm_jit(np.zeros((1, 6), dtype=np.float32))
+
+
+def max_accel_norm(sensor_array: np.ndarray) -> float:
+    """Peak acceleration magnitude over the (T, 6) sensor rows, 0.0 for an empty swing."""
+    if njit is None:
+        return _max_accel_norm_numpy(sensor_array)
+    return float(_max_accel_norm_jit(sensor_array))
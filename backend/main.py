@@ -1,18 +1,39 @@
-from dataclasses import dataclass
-from typing import List, Optional
+import asyncio
+import gc
+import hashlib
+import logging
+import math
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from itertools import chain
+from operator import itemgetter, methodcaller
+from typing import Annotated, Any, Dict, Iterator, List, NoReturn, Optional, Tuple
 
-import json
 from pathlib import Path
 
 import numpy as np
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, Field, WithJsonSchema
 
-from ml_model import get_classifier
+from features import max_accel_norm
+from ml_model import CLASS_NAMES, get_classifier
 
+logger = logging.getLogger(__name__)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await _flush_session_stats()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 origins = [
     "http://localhost:5173",
@@ -28,21 +49,66 @@ app.add_middleware(
 )
 
 
+@contextmanager
+def _gc_paused():
+    """Hold off cyclic GC while allocating many short-lived objects; usable as a decorator.
+
+    Nothing inside the block may await, or other tasks would run with GC disabled too.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+# Swings at least this long are converted with GC paused
+_GC_PAUSE_MIN_SAMPLES = 500
+
+_SENSOR_FIELDS = ("ax", "ay", "az", "gx", "gy", "gz")
+_sample_fields = itemgetter(*_SENSOR_FIELDS)
+# A null t reads back as NaN and is rejected with the sensor values
+_sample_time = methodcaller("get", "t", 0.0)
+
+
+# Only feeds the OpenAPI schema of SwingRequest.samples; requests never build it
 class SwingSample(BaseModel):
+    """One IMU reading: acceleration (ax, ay, az), angular rate (gx, gy, gz) and optional time t."""
+
     ax: float
     ay: float
     az: float
     gx: float
     gy: float
     gz: float
-    t: float
+    t: float = 0.0
+
+
+_SAMPLES_SCHEMA = {
+    "type": "array",
+    "items": {
+        "anyOf": [
+            SwingSample.model_json_schema(),
+            {"type": "array", "items": {"type": "number"}, "minItems": 6, "maxItems": 7},
+        ]
+    },
+}
 
 
 class SwingRequest(BaseModel):
     player_id: str
     session_id: Optional[str] = None
     sampling_rate_hz: float
-    samples: List[SwingSample]
+    # Left unvalidated here: building a model per sample costs more than the inference.
+    # _sensor_array checks the values while converting them.
+    samples: Annotated[List[Any], WithJsonSchema(_SAMPLES_SCHEMA)] = Field(
+        description=(
+            "Either objects with ax, ay, az, gx, gy, gz (and optional t) keys, "
+            "or rows of [ax, ay, az, gx, gy, gz] with an optional trailing t."
+        ),
+    )
 
 
 class ClassificationResult(BaseModel):
@@ -99,54 +165,146 @@ class PlayerHistoryResponse(BaseModel):
     sessions: List[SessionSummary]
 
 
-@dataclass
-class _ShotAccumulator:
-    count: int = 0
-    sum_confidence: float = 0.0
-    sum_speed_mps: float = 0.0
-
-
-_SESSION_STATS: dict = {}
-
-_STATS_FILE = Path(__file__).resolve().parent / "data" / "session_stats.json"
-
-
-def _load_session_stats() -> None:
-    global _SESSION_STATS
-    if not _STATS_FILE.exists():
-        return
-    data = json.loads(_STATS_FILE.read_text(encoding="utf-8"))
-    restored: dict = {}
-    for key_str, per_shot in data.items():
-        player_id, session_id_raw = key_str.split("|", 1)
-        session_id_val = session_id_raw or None
-        inner: dict = {}
-        for shot_type, acc_dict in per_shot.items():
-            inner[shot_type] = _ShotAccumulator(
-                count=int(acc_dict.get("count", 0)),
-                sum_confidence=float(acc_dict.get("sum_confidence", 0.0)),
-                sum_speed_mps=float(acc_dict.get("sum_speed_mps", 0.0)),
-            )
-        restored[(player_id, session_id_val)] = inner
-    _SESSION_STATS = restored
+# Stats live in a memory-mapped record file, one row per (player_id, session_id, shot_type).
+# Swings update the mapped pages in place and the kernel writes them back; the dicts below
+# only map keys to row numbers and are rebuilt from _STATS_KEYS_FILE on startup.
+_STATS_DTYPE = np.dtype([("count", "i8"), ("sum_confidence", "f8"), ("sum_speed_mps", "f8")])
+_INITIAL_STATS_CAPACITY = 4096
+
+_DATA_DIR = Path(__file__).resolve().parent / "data"
+_STATS_FILE = _DATA_DIR / "session_stats.bin"
+# One JSON line [row, player_id, session_id, shot_type] per row, so a lost line cannot shift later rows
+_STATS_KEYS_FILE = _DATA_DIR / "session_stats.keys"
+# Stats from before the binary store, imported once when _STATS_KEYS_FILE does not exist yet
+_LEGACY_STATS_FILE = _DATA_DIR / "session_stats.json"
+# Exists only while that import runs, so a stats file left next to it is known to be partial
+_STATS_IMPORT_MARKER = _DATA_DIR / "session_stats.importing"
+
+# Set by _map_stats_file; the three arrays are field views into the mapping
+_STATS: Optional[np.memmap] = None
+_COUNTS: np.ndarray
+_SUM_CONFIDENCE: np.ndarray
+_SUM_SPEED_MPS: np.ndarray
+# Position of the row's shot type in alphabetical order, so shots sort as plain ints
+_SHOT_RANKS = np.zeros(_INITIAL_STATS_CAPACITY, dtype=np.int16)
+
+# shot_type -> rank; extended by _shot_rank when a shot type outside CLASS_NAMES shows up
+_SHOT_ORDER = {shot_type: rank for rank, shot_type in enumerate(sorted(CLASS_NAMES))}
+
+# row -> (player_id, session_id, shot_type), None for a row whose key line was lost
+_ROW_KEYS: List[Optional[Tuple[str, Optional[str], str]]] = []
+# (player_id, session_id) -> {shot_type: row}
+_SESSION_ROWS: Dict[Tuple[str, Optional[str]], Dict[str, int]] = {}
+# player_id -> rows of every session of that player
+_PLAYER_ROWS: Dict[str, List[int]] = {}
+# player_id -> that player's session ids, in first-seen order
+_PLAYER_SESSIONS: Dict[str, List[Optional[str]]] = {}
+
+# player_id -> encoded /api/player-history body, dropped when the player records a swing
+_PLAYER_HISTORY_CACHE: Dict[str, bytes] = {}
+
+# (player_id, session_id) -> swings recorded since startup; part of every response cache key
+_STATS_VERSION: Dict[Tuple[str, Optional[str]], int] = {}
+
+_RESPONSE_CACHE_SIZE = 10_000
+# (endpoint, player_id, session_id, version) -> encoded response body
+_RESPONSE_CACHE: "OrderedDict[tuple, bytes]" = OrderedDict()
+
+_SAVE_DEBOUNCE_S = 0.5
+
+# A single writer thread keeps key appends and flushes in submission order
+_STATS_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stats-writer")
+_save_task: Optional[asyncio.Task] = None
+
+
+def _grown(arr: np.ndarray) -> np.ndarray:
+    grown = np.zeros(2 * len(arr), dtype=arr.dtype)
+    grown[: len(arr)] = arr
+    return grown
+
+
+def _shot_rank(shot_type: str) -> int:
+    rank = _SHOT_ORDER.get(shot_type)
+    if rank is None:
+        # New shot type: rank it alphabetically and shift the ranks already handed out.
+        # Only types outside CLASS_NAMES land here, so this is rare.
+        order = {name: new_rank for new_rank, name in enumerate(sorted([*_SHOT_ORDER, shot_type]))}
+        remap = np.empty(len(_SHOT_ORDER), dtype=_SHOT_RANKS.dtype)
+        for name, old_rank in _SHOT_ORDER.items():
+            remap[old_rank] = order[name]
+        n_rows = len(_ROW_KEYS)
+        _SHOT_RANKS[:n_rows] = remap[_SHOT_RANKS[:n_rows]]
+        _SHOT_ORDER.clear()
+        _SHOT_ORDER.update(order)
+        rank = order[shot_type]
+    return rank
+
+
+def _map_stats_file(capacity: int) -> None:
+    global _STATS, _COUNTS, _SUM_CONFIDENCE, _SUM_SPEED_MPS
+    if _STATS is not None:
+        _STATS.flush()
+    # Release the old mapping before resizing the file underneath it
+    _STATS = _COUNTS = _SUM_CONFIDENCE = _SUM_SPEED_MPS = None
+    _DATA_DIR.mkdir(parents=True, exist_ok=True)
+    _STATS_FILE.touch(exist_ok=True)
+    size = capacity * _STATS_DTYPE.itemsize
+    if _STATS_FILE.stat().st_size < size:
+        # Extending the file reads back as zeros, i.e. empty rows
+        with _STATS_FILE.open("r+b") as fh:
+            fh.truncate(size)
+    _STATS = np.memmap(_STATS_FILE, dtype=_STATS_DTYPE, mode="r+", shape=(capacity,))
+    _COUNTS = _STATS["count"]
+    _SUM_CONFIDENCE = _STATS["sum_confidence"]
+    _SUM_SPEED_MPS = _STATS["sum_speed_mps"]
+
+
+def _append_stats_key(line: bytes) -> None:
+    try:
+        with _STATS_KEYS_FILE.open("ab") as fh:
+            fh.write(line)
+    except Exception:
+        # Nobody waits on the writer's futures, so this is the only trace of the failure
+        logger.exception("Could not append %r to %s; that row is dropped on restart", line, _STATS_KEYS_FILE)
 
 
-def _save_session_stats() -> None:
-    _STATS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    serializable: dict = {}
-    for (player_id, session_id), per_shot in _SESSION_STATS.items():
-        key = f"{player_id}|{session_id or ''}"
-        serializable[key] = {}
-        for shot_type, acc in per_shot.items():
-            serializable[key][shot_type] = {
-                "count": acc.count,
-                "sum_confidence": acc.sum_confidence,
-                "sum_speed_mps": acc.sum_speed_mps,
-            }
-    _STATS_FILE.write_text(json.dumps(serializable), encoding="utf-8")
+def _flush_stats_store() -> None:
+    stats = _STATS
+    if stats is not None:
+        stats.flush()
 
 
-_load_session_stats()
+def _stats_row(
+    player_id: str,
+    session_id: Optional[str],
+    shot_type: str,
+    record_key: bool = True,
+    at_row: Optional[int] = None,
+) -> int:
+    """Row of the key, created at at_row (default: the next free row) when the key is new."""
+    global _SHOT_RANKS
+    per_shot = _SESSION_ROWS.get((player_id, session_id))
+    if per_shot is None:
+        per_shot = {}
+        _SESSION_ROWS[(player_id, session_id)] = per_shot
+        _PLAYER_SESSIONS.setdefault(player_id, []).append(session_id)
+    row = per_shot.get(shot_type)
+    if row is None:
+        row = len(_ROW_KEYS) if at_row is None else at_row
+        while row >= len(_STATS):
+            _map_stats_file(2 * len(_STATS))
+        while row >= len(_SHOT_RANKS):
+            _SHOT_RANKS = _grown(_SHOT_RANKS)
+        _SHOT_RANKS[row] = _shot_rank(shot_type)
+        if row >= len(_ROW_KEYS):
+            _ROW_KEYS.extend([None] * (row + 1 - len(_ROW_KEYS)))
+        _ROW_KEYS[row] = (player_id, session_id, shot_type)
+        per_shot[shot_type] = row
+        _PLAYER_ROWS.setdefault(player_id, []).append(row)
+        if record_key:
+            line = orjson.dumps((row, player_id, session_id, shot_type), option=orjson.OPT_APPEND_NEWLINE)
+            _STATS_WRITER.submit(_append_stats_key, line)
+    return row
 
 
 def _update_session_stats(
@@ -156,18 +314,235 @@ def _update_session_stats(
     confidence: float,
     speed_mps: float,
 ) -> None:
+    row = _stats_row(player_id, session_id, shot_type)
+    _COUNTS[row] += 1
+    _SUM_CONFIDENCE[row] += confidence
+    _SUM_SPEED_MPS[row] += speed_mps
+    _PLAYER_HISTORY_CACHE.pop(player_id, None)
     key = (player_id, session_id)
-    per_shot = _SESSION_STATS.get(key)
-    if per_shot is None:
-        per_shot = {}
-        _SESSION_STATS[key] = per_shot
-    acc = per_shot.get(shot_type)
-    if acc is None:
-        acc = _ShotAccumulator()
-        per_shot[shot_type] = acc
-    acc.count += 1
-    acc.sum_confidence += float(confidence)
-    acc.sum_speed_mps += float(speed_mps)
+    _STATS_VERSION[key] = _STATS_VERSION.get(key, 0) + 1
+
+
+def _import_legacy_stats() -> None:
+    _DATA_DIR.mkdir(parents=True, exist_ok=True)
+    _STATS_IMPORT_MARKER.touch()
+    _map_stats_file(_INITIAL_STATS_CAPACITY)
+
+    if _LEGACY_STATS_FILE.exists():
+        data = orjson.loads(_LEGACY_STATS_FILE.read_bytes())
+        # {"player|session": {shot_type: {count, sum_confidence, sum_speed_mps}}}
+        for key_str, per_shot in data.items():
+            player_id, session_id_raw = key_str.split("|", 1)
+            session_id_val = session_id_raw or None
+            for shot_type, acc_dict in per_shot.items():
+                row = _stats_row(player_id, session_id_val, shot_type, record_key=False)
+                _COUNTS[row] = int(acc_dict.get("count", 0))
+                _SUM_CONFIDENCE[row] = float(acc_dict.get("sum_confidence", 0.0))
+                _SUM_SPEED_MPS[row] = float(acc_dict.get("sum_speed_mps", 0.0))
+
+    _STATS.flush()
+    # The keys file appearing marks the import as complete
+    tmp_path = _STATS_KEYS_FILE.with_suffix(".tmp")
+    tmp_path.write_bytes(
+        b"".join(orjson.dumps((row, *key), option=orjson.OPT_APPEND_NEWLINE) for row, key in enumerate(_ROW_KEYS))
+    )
+    os.replace(tmp_path, _STATS_KEYS_FILE)
+    _STATS_IMPORT_MARKER.unlink()
+
+
+@_gc_paused()
+def _load_session_stats() -> None:
+    if not _STATS_KEYS_FILE.exists():
+        if _STATS_IMPORT_MARKER.exists():
+            # Partial output of an interrupted import; redo it from the legacy file
+            _STATS_FILE.unlink(missing_ok=True)
+        elif _STATS_FILE.exists():
+            # Without its keys the rows cannot be attributed, but they may be the only copy
+            orphaned = _STATS_FILE.with_name(f"{_STATS_FILE.name}.orphaned-{int(time.time())}")
+            os.replace(_STATS_FILE, orphaned)
+            logger.error(
+                "%s is missing; moved %s to %s and re-imported %s, which may be stale",
+                _STATS_KEYS_FILE,
+                _STATS_FILE,
+                orphaned,
+                _LEGACY_STATS_FILE,
+            )
+        _import_legacy_stats()
+        return
+
+    if _STATS_FILE.exists():
+        capacity = max(_INITIAL_STATS_CAPACITY, _STATS_FILE.stat().st_size // _STATS_DTYPE.itemsize)
+    else:
+        logger.warning("%s is missing; every key in %s starts from zero", _STATS_FILE, _STATS_KEYS_FILE)
+        capacity = _INITIAL_STATS_CAPACITY
+    _map_stats_file(capacity)
+    lines = _STATS_KEYS_FILE.read_bytes().splitlines(keepends=True)
+    for n_valid, line in enumerate(lines):
+        try:
+            entry = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # Torn last line from an interrupted append: cut it so later appends start clean
+            with _STATS_KEYS_FILE.open("r+b") as fh:
+                fh.truncate(sum(len(valid) for valid in lines[:n_valid]))
+            break
+        # Lines without a row number predate it and sit at their row's position
+        row, player_id, session_id, shot_type = entry if len(entry) == 4 else (n_valid, *entry)
+        _stats_row(player_id, session_id, shot_type, record_key=False, at_row=row)
+
+    # Rows whose key line was lost, or never written, cannot be attributed to anyone. Only
+    # clear the ones holding data so the empty tail of the file is not dirtied on every start.
+    n_rows = len(_ROW_KEYS)
+    stale = np.flatnonzero(_COUNTS[n_rows:]) + n_rows
+    lost = [row for row, key in enumerate(_ROW_KEYS) if key is None]
+    if lost:
+        logger.warning("%d rows of %s have no key in %s; discarding them", len(lost), _STATS_FILE, _STATS_KEYS_FILE)
+        stale = np.concatenate([np.asarray(lost, dtype=stale.dtype), stale])
+    if stale.size:
+        _STATS[stale] = 0
+
+
+def _response_cache_key(endpoint: str, player_id: str, session_id: Optional[str]) -> tuple:
+    return (endpoint, player_id, session_id, _STATS_VERSION.get((player_id, session_id), 0))
+
+
+def _cached_response(key: tuple) -> Optional[Response]:
+    body = _RESPONSE_CACHE.get(key)
+    if body is None:
+        return None
+    _RESPONSE_CACHE.move_to_end(key)
+    return Response(content=body, media_type="application/json")
+
+
+def _cache_response(key: tuple, payload) -> Response:
+    body = orjson.dumps(payload)
+    _RESPONSE_CACHE[key] = body
+    if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+        _RESPONSE_CACHE.popitem(last=False)
+    return Response(content=body, media_type="application/json")
+
+
+async def _schedule_save() -> None:
+    """Coalesce every swing within the debounce window into one flush of the mapped stats."""
+    global _save_task
+    await asyncio.sleep(_SAVE_DEBOUNCE_S)
+    _save_task = None
+    await asyncio.get_running_loop().run_in_executor(_STATS_WRITER, _flush_stats_store)
+
+
+def _request_save() -> None:
+    global _save_task
+    if _save_task is None:
+        _save_task = asyncio.create_task(_schedule_save())
+
+
+async def _flush_session_stats() -> None:
+    if _save_task is not None:
+        _save_task.cancel()
+    await asyncio.get_running_loop().run_in_executor(_STATS_WRITER, _flush_stats_store)
+
+
+_load_session_stats()
+
+
+_FLOAT32_MAX = float(np.finfo(np.float32).max)
+
+
+def _is_float32(value: Any) -> bool:
+    try:
+        number = float(value)
+    except (TypeError, ValueError, OverflowError):
+        return False
+    return math.isfinite(number) and abs(number) <= _FLOAT32_MAX
+
+
+def _reject_samples(samples: List[Any]) -> NoReturn:
+    """Raise a 422 naming the first sample _sensor_array could not convert."""
+    as_objects = isinstance(samples[0], dict)
+    for index, sample in enumerate(samples):
+        if as_objects:
+            if type(sample) is not dict:
+                detail = f"samples[{index}] must be an object like samples[0]"
+                break
+            missing = [field for field in _SENSOR_FIELDS if field not in sample]
+            if missing:
+                detail = f"samples[{index}].{missing[0]} is missing"
+                break
+            fields = [(field, sample[field]) for field in _SENSOR_FIELDS]
+            if "t" in sample:
+                fields.append(("t", sample["t"]))
+        else:
+            if type(sample) is not list or not 6 <= len(sample) <= 7:
+                detail = f"samples[{index}] must be [ax, ay, az, gx, gy, gz] with an optional trailing t"
+                break
+            fields = list(zip((*_SENSOR_FIELDS, "t"), sample))
+        bad = [field for field, value in fields if not _is_float32(value)]
+        if bad:
+            detail = f"samples[{index}].{bad[0]} must be a finite float32 number"
+            break
+    else:
+        detail = "samples could not be converted"
+    raise HTTPException(status_code=422, detail=f"Invalid swing samples: {detail}")
+
+
+def _sensor_array(samples: List[Any]) -> np.ndarray:
+    n_samples = len(samples)
+    as_objects = n_samples > 0 and isinstance(samples[0], dict)
+    if as_objects:
+        rows = map(_sample_fields, samples)
+        n_values = n_samples * 6
+    else:
+        # Rows are converted whole, t included, so only lists of 6 or 7 numbers may pass
+        widths = None
+        if set(map(type, samples)) <= {list}:
+            widths = np.fromiter(map(len, samples), dtype=np.intp, count=n_samples)
+        if widths is None or ((widths < 6) | (widths > 7)).any():
+            _reject_samples(samples)
+        rows = samples
+        n_values = int(widths.sum())
+    try:
+        # Fill one float32 buffer straight from the samples, without per-row lists. Values
+        # beyond float32 range become inf and are rejected below, so the cast warning is noise.
+        with np.errstate(over="ignore"), _gc_paused() if n_samples >= _GC_PAUSE_MIN_SAMPLES else nullcontext():
+            values = np.fromiter(chain.from_iterable(rows), dtype=np.float32, count=n_values)
+            times = values
+            if as_objects:
+                # Object samples carry t under its own key; check it like the row form does
+                times = np.fromiter(map(_sample_time, samples), dtype=np.float32, count=n_samples)
+    except (KeyError, IndexError, TypeError, ValueError, OverflowError):
+        _reject_samples(samples)
+    # NaN, infinities and values beyond float32 range (which overflow to inf) would poison the stored sums
+    if not (np.isfinite(values).all() and np.isfinite(times).all()):
+        _reject_samples(samples)
+    if n_values == n_samples * 6:
+        return values.reshape(n_samples, 6)
+    # Some rows carry t: gather the six sensor values from the start of each row
+    row_starts = np.cumsum(widths) - widths
+    return values[row_starts[:, None] + np.arange(6)]
+
+
+# Inference runs off the event loop; one worker keeps calls into the Keras model serialized
+_INFERENCE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
+
+_PREDICTION_CACHE_SIZE = 1024
+_PREDICTION_CACHE: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+
+
+# Scratch for _swing_signature, which only runs on the event loop thread. Longer swings get
+# a one-off buffer so a single huge request cannot pin memory. The sensor array itself is not
+# pooled: it stays in use across the inference await while other requests run.
+_SIGNATURE_SCRATCH_ROWS = 4096
+_SIGNATURE_SCRATCH = np.empty((_SIGNATURE_SCRATCH_ROWS, 6), dtype=np.float32)
+
+
+def _swing_signature(sensor_array: np.ndarray) -> bytes:
+    n_samples = sensor_array.shape[0]
+    if n_samples <= _SIGNATURE_SCRATCH_ROWS:
+        quantized = _SIGNATURE_SCRATCH[:n_samples]
+    else:
+        quantized = np.empty((n_samples, 6), dtype=np.float32)
+    # Rounding first lets near-identical swings (e.g. repeated drills) share a cache entry
+    np.round(sensor_array, 2, out=quantized)
+    return hashlib.blake2b(quantized.data, digest_size=16).digest()
 
 
 @app.get("/health")
@@ -177,14 +552,8 @@ async def health() -> dict:
 
 @app.post("/api/swing/classify", response_model=SwingResponse)
 async def classify_swing(payload: SwingRequest) -> SwingResponse:
-    sensor_array = np.array(
-        [[s.ax, s.ay, s.az, s.gx, s.gy, s.gz] for s in payload.samples],
-        dtype=float,
-    )
-    accel_norm = 0.0
-    if sensor_array.size > 0:
-        accel = sensor_array[:, :3]
-        accel_norm = float(np.linalg.norm(accel, axis=1).max())
+    sensor_array = _sensor_array(payload.samples)
+    accel_norm = max_accel_norm(sensor_array)
 
     classifier = get_classifier()
 
@@ -193,11 +562,26 @@ async def classify_swing(payload: SwingRequest) -> SwingResponse:
     confidence = 0.75
 
     if classifier.is_ready and sensor_array.size > 0:
-        try:
-            shot_type, confidence = classifier.predict(sensor_array)
-        except Exception:
-            # Fall back to stub values if anything goes wrong
-            pass
+        signature = _swing_signature(sensor_array)
+        cached = _PREDICTION_CACHE.get(signature)
+        if cached is not None:
+            _PREDICTION_CACHE.move_to_end(signature)
+            shot_type, confidence = cached
+        else:
+            try:
+                predicted_type, predicted_confidence = await asyncio.get_running_loop().run_in_executor(
+                    _INFERENCE_EXECUTOR, classifier.predict, sensor_array
+                )
+            except Exception:
+                # Fall back to stub values if anything goes wrong
+                pass
+            else:
+                # A NaN confidence would poison the stored averages; keep the stub values instead
+                if math.isfinite(predicted_confidence):
+                    shot_type, confidence = predicted_type, predicted_confidence
+                    _PREDICTION_CACHE[signature] = (shot_type, confidence)
+                    if len(_PREDICTION_CACHE) > _PREDICTION_CACHE_SIZE:
+                        _PREDICTION_CACHE.popitem(last=False)
 
     accuracy_score = float(confidence)
 
@@ -215,7 +599,7 @@ async def classify_swing(payload: SwingRequest) -> SwingResponse:
         confidence=confidence,
         speed_mps=accel_norm,
     )
-    _save_session_stats()
+    _request_save()
 
     return SwingResponse(
         player_id=payload.player_id,
@@ -224,119 +608,129 @@ async def classify_swing(payload: SwingRequest) -> SwingResponse:
     )
 
 
-@app.get("/api/leaderboard", response_model=List[LeaderboardEntry])
-async def get_leaderboard() -> List[LeaderboardEntry]:
+def _shot_stats_by_row(rows: List[int]) -> Iterator[Tuple[int, dict]]:
+    """Yield (row, shot stats) for the non-empty rows, ordered by shot type."""
+    idx = np.asarray(rows, dtype=np.intp)
+    idx = idx[np.argsort(_SHOT_RANKS[idx], kind="stable")]
+    counts = _COUNTS[idx]
+    non_empty = counts > 0
+    idx = idx[non_empty]
+    counts = counts[non_empty]
+    average_confidence = (_SUM_CONFIDENCE[idx] / counts).tolist()
+    average_speed_mps = (_SUM_SPEED_MPS[idx] / counts).tolist()
+    for row, count, avg_conf, avg_speed in zip(idx.tolist(), counts.tolist(), average_confidence, average_speed_mps):
+        yield row, {
+            "shot_type": _ROW_KEYS[row][2],
+            "count": count,
+            "average_confidence": avg_conf,
+            "average_speed_mps": avg_speed,
+        }
+
+
+# Read endpoints build plain dicts and return them directly, skipping response_model
+# re-validation; `responses` keeps the schemas in the OpenAPI docs.
+@app.get("/api/leaderboard", responses={200: {"model": List[LeaderboardEntry]}})
+async def get_leaderboard() -> ORJSONResponse:
     entries = [
-        LeaderboardEntry(player_id="player_1", score=98.5, rank=1),
-        LeaderboardEntry(player_id="player_2", score=92.0, rank=2),
-        LeaderboardEntry(player_id="player_3", score=88.0, rank=3),
+        {"player_id": "player_1", "score": 98.5, "rank": 1},
+        {"player_id": "player_2", "score": 92.0, "rank": 2},
+        {"player_id": "player_3", "score": 88.0, "rank": 3},
     ]
-    return entries
+    return ORJSONResponse(entries)
+
+
+@app.get("/api/session-stats", responses={200: {"model": SessionStatsResponse}})
+async def get_session_stats(player_id: str, session_id: Optional[str] = None) -> Response:
+    cache_key = _response_cache_key("session-stats", player_id, session_id)
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
+
+    per_shot = _SESSION_ROWS.get((player_id, session_id), {})
+    shots = [shot for _, shot in _shot_stats_by_row(list(per_shot.values()))]
+
+    return _cache_response(cache_key, {"player_id": player_id, "session_id": session_id, "shots": shots})
+
+
+# Static part of every challenge; get_challenges adds the per-player progress fields
+_BASE_CHALLENGES = (
+    {
+        "id": "c1",
+        "title": "Forehand Accuracy",
+        "description": "Hit 20 consistent forehands above 80% accuracy.",
+        "target_shot": "Forehand",
+        "target_accuracy": 0.8,
+    },
+    {
+        "id": "c2",
+        "title": "Backhand Power",
+        "description": "Perform 10 strong backhands with high racket speed.",
+        "target_shot": "Backhand",
+        "target_accuracy": 0.75,
+    },
+)
 
 
-@app.get("/api/session-stats", response_model=SessionStatsResponse)
-async def get_session_stats(player_id: str, session_id: Optional[str] = None) -> SessionStatsResponse:
-    key = (player_id, session_id)
-    per_shot = _SESSION_STATS.get(key, {})
-
-    shots: List[ShotStats] = []
-    for shot_type, acc in per_shot.items():
-        if acc.count <= 0:
-            continue
-        shots.append(
-            ShotStats(
-                shot_type=shot_type,
-                count=acc.count,
-                average_confidence=acc.sum_confidence / acc.count,
-                average_speed_mps=acc.sum_speed_mps / acc.count,
-            )
-        )
+@app.get("/api/challenges", responses={200: {"model": List[Challenge]}})
+async def get_challenges(player_id: str = "practice_player", session_id: Optional[str] = "practice_session") -> Response:
+    cache_key = _response_cache_key("challenges", player_id, session_id)
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
+
+    per_shot = _SESSION_ROWS.get((player_id, session_id), {})
 
-    shots.sort(key=lambda s: s.shot_type)
+    challenges: List[dict] = []
+    for base in _BASE_CHALLENGES:
+        row = per_shot.get(base["target_shot"])
+        count = 0 if row is None else int(_COUNTS[row])
+        if count <= 0:
+            overlay = {"status": "not_started", "progress": 0.0, "current_accuracy": None, "current_swings": 0}
+        else:
+            current_acc = float(_SUM_CONFIDENCE[row]) / count
+            if current_acc >= base["target_accuracy"]:
+                status, progress = "completed", 1.0
+            else:
+                status = "in_progress"
+                progress = float(max(0.0, min(1.0, current_acc / base["target_accuracy"])))
+            overlay = {"status": status, "progress": progress, "current_accuracy": current_acc, "current_swings": count}
+        challenges.append({**base, **overlay})
 
-    return SessionStatsResponse(player_id=player_id, session_id=session_id, shots=shots)
+    return _cache_response(cache_key, challenges)
 
 
-@app.get("/api/challenges", response_model=List[Challenge])
-async def get_challenges(player_id: str = "practice_player", session_id: Optional[str] = "practice_session") -> List[Challenge]:
-    base_challenges = [
-        Challenge(
-            id="c1",
-            title="Forehand Accuracy",
-            description="Hit 20 consistent forehands above 80% accuracy.",
-            target_shot="Forehand",
-            target_accuracy=0.8,
-        ),
-        Challenge(
-            id="c2",
-            title="Backhand Power",
-            description="Perform 10 strong backhands with high racket speed.",
-            target_shot="Backhand",
-            target_accuracy=0.75,
-        ),
-    ]
+@app.get("/api/player-history", responses={200: {"model": PlayerHistoryResponse}})
+async def get_player_history(player_id: str) -> Response:
+    body = _PLAYER_HISTORY_CACHE.get(player_id)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
 
-    key = (player_id, session_id)
-    per_shot = _SESSION_STATS.get(key, {})
-
-    challenges: List[Challenge] = []
-    for ch in base_challenges:
-        stats = per_shot.get(ch.target_shot)
-        if stats is None or stats.count <= 0:
-            ch.status = "not_started"
-            ch.progress = 0.0
-            ch.current_accuracy = None
-            ch.current_swings = 0
-        else:
-            current_acc = stats.sum_confidence / stats.count
-            ch.current_accuracy = float(current_acc)
-            ch.current_swings = int(stats.count)
-            if current_acc >= ch.target_accuracy:
-                ch.status = "completed"
-                ch.progress = 1.0
-            else:
-                ch.status = "in_progress"
-                ch.progress = float(max(0.0, min(1.0, current_acc / ch.target_accuracy)))
-        challenges.append(ch)
-
-    return challenges
-
-
-@app.get("/api/player-history", response_model=PlayerHistoryResponse)
-async def get_player_history(player_id: str) -> PlayerHistoryResponse:
-    sessions: List[SessionSummary] = []
-
-    for (pid, sid), per_shot in _SESSION_STATS.items():
-        if pid != player_id:
-            continue
-        shots: List[ShotStats] = []
-        for shot_type, acc in per_shot.items():
-            if acc.count <= 0:
-                continue
-            shots.append(
-                ShotStats(
-                    shot_type=shot_type,
-                    count=acc.count,
-                    average_confidence=acc.sum_confidence / acc.count,
-                    average_speed_mps=acc.sum_speed_mps / acc.count,
-                )
-            )
-        shots.sort(key=lambda s: s.shot_type)
-        sessions.append(SessionSummary(session_id=sid, shots=shots))
+    session_ids = _PLAYER_SESSIONS.get(player_id, [])
+    shots_by_session: Dict[Optional[str], List[dict]] = {sid: [] for sid in session_ids}
+    for row, shot in _shot_stats_by_row(_PLAYER_ROWS.get(player_id, [])):
+        shots_by_session[_ROW_KEYS[row][1]].append(shot)
 
     # Sort sessions by session_id (None last)
-    sessions.sort(key=lambda s: (s.session_id is None, s.session_id or ""))
+    ordered_ids: List[Optional[str]] = sorted(sid for sid in shots_by_session if sid is not None)
+    if None in shots_by_session:
+        ordered_ids.append(None)
+    sessions = [{"session_id": sid, "shots": shots_by_session[sid]} for sid in ordered_ids]
 
-    return PlayerHistoryResponse(player_id=player_id, sessions=sessions)
+    body = orjson.dumps({"player_id": player_id, "sessions": sessions})
+    # Only known players are cached, so arbitrary ids cannot grow the cache
+    if session_ids:
+        _PLAYER_HISTORY_CACHE[player_id] = body
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/model-metrics")
-async def get_model_metrics() -> dict:
+async def get_model_metrics() -> Response:
     metrics_path = Path(__file__).resolve().parent / "models" / "neurasentinel_metrics.json"
     if not metrics_path.exists():
         raise HTTPException(status_code=404, detail="Model metrics not found. Train the model first.")
     try:
-        data = json.loads(metrics_path.read_text(encoding="utf-8"))
+        # The file is already JSON, so serve the bytes as-is instead of decoding and re-encoding
+        content = metrics_path.read_bytes()
     except Exception as exc:  # pragma: no cover - defensive
         raise HTTPException(status_code=500, detail=f"Failed to read metrics: {exc}")
-    return data
+    return Response(content=content, media_type="application/json")
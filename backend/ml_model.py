@@ -42,8 +42,9 @@ class SwingClassifier:
 
         if MODEL_PATH.exists() and MEAN_PATH.exists() and SCALE_PATH.exists():
             self.model = tf.keras.models.load_model(MODEL_PATH)
-            self.mean = np.load(MEAN_PATH)
-            self.scale = np.load(SCALE_PATH)
+            # Keep the scaler in float32 so normalized swings stay float32 all the way into the model
+            self.mean = np.load(MEAN_PATH).astype(np.float32)
+            self.scale = np.load(SCALE_PATH).astype(np.float32)
 
     @property
     def is_ready(self) -> bool:
@@ -53,7 +54,7 @@ class SwingClassifier:
         if sensor_array.ndim != 2 or sensor_array.shape[1] != 6:
             raise ValueError("Expected sensor_array shape (T, 6)")
 
-        x = pad_or_truncate(sensor_array)
+        x = pad_or_truncate(sensor_array.astype(np.float32, copy=False))
         if self.mean is None or self.scale is None:
             raise RuntimeError("Scaler parameters not loaded")
         x = (x - self.mean) / self.scale
@@ -63,7 +64,7 @@ class SwingClassifier:
         if not self.is_ready:
             raise RuntimeError("Model is not ready")
         if not isinstance(sensor_array, np.ndarray):
-            sensor_array = np.array(sensor_array, dtype=float)
+            sensor_array = np.array(sensor_array, dtype=np.float32)
 
         x = self._preprocess(sensor_array)
         probs = self.model.predict(x, verbose=0)[0]